@@ -2,7 +2,10 @@
 
 import sys
 
+from loguru import logger
+
 from spycewar.app import App
+from spycewar.config import get_cfg
 
 
 def main(args: list[str] | None = None) -> int:
@@ -14,6 +17,10 @@ def main(args: list[str] | None = None) -> int:
     if args is None:
         args = sys.argv[1:]
 
+    # The per-collision messages are logged at debug level, so they are only formatted in debug mode
+    logger.remove()
+    logger.add(sys.stderr, level="DEBUG" if get_cfg("game", "debug_mode") else "INFO")
+
     app = App()
     app.run()
     return 0
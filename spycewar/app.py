@@ -3,25 +3,29 @@
 It sets up the game window, manages game states, and controls the game loop.
 """
 
-import os
 from random import randint
 
 import pygame
 from loguru import logger
+from pygame import Rect, Surface
 from pygame.event import Event
 from pygame.locals import (
     DOUBLEBUF,
     K_ESCAPE,
     KEYDOWN,
+    KEYUP,
+    NOEVENT,
     QUIT,
     RESIZABLE,
+    SCALED,
     USEREVENT,
+    VIDEOEXPOSE,
     VIDEORESIZE,
 )
 from pygame.time import Clock
 
-from spycewar.config import get_cfg, set_cfg
-from spycewar.constants import GAME_NAME, SCREEN_HEIGHT_ENV_VAR, SCREEN_WIDTH_ENV_VAR
+from spycewar.config import get_cfg
+from spycewar.constants import FPS, FRAME_PERIOD, GAME_NAME
 from spycewar.events import Events
 from spycewar.states.state_manager import StateManager
 
@@ -36,13 +40,16 @@ class App:
         __clock: The Pygame clock object.
         __state_manager: The state manager object.
         __running: A boolean indicating whether the game is running or not.
+        __background: The pre-rendered background (colour and starfield) used to clear the screen.
+        __dirty_rects: The areas of the screen drawn in the previous frame, to be cleared in the next one.
+        __full_update: A boolean indicating whether the whole screen must be updated in the next frame.
     """
 
     def __init__(self) -> None:
         logger.info("Initializing game...")
         pygame.init()
-        # pygame.event.set_blocked(None)
-        # pygame.event.set_allowed([KEYDOWN, KEYUP, QUIT])
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([QUIT, KEYDOWN, KEYUP, USEREVENT, VIDEORESIZE, VIDEOEXPOSE])
 
         self.__background_colour = DEFAULT_COLOUR
         self.__screen = self.__initialise_screen()
@@ -50,18 +57,42 @@ class App:
         self.__state_manager = StateManager()
         self.__running = False
         self.__starfield = self.__generate_starfield()
+        self.__background = self.__render_background()
+        self.__dirty_rects: list[Rect] = []
+        self.__full_update = True
 
     def run(self) -> None:
-        """Runs the game loop."""
+        """Runs the game loop.
+
+        The SDL event queue is pumped exactly once per frame (at `FPS`), which is enough since SDL
+        buffers the events in between.
+
+        When the current state is static (e.g. the intro screen), the loop waits up to a frame period
+        for an event instead of polling, so it still runs about `FPS` times per second. The whole screen
+        is then rendered again only if an event arrived.
+
+        The methods called every frame are bound once before entering the loop. They delegate to
+        the current state through the state manager, so they stay valid across state changes.
+        """
 
         self.__running = True
         logger.info("Starting game loop...")
 
-        while self.is_running:
-            delta_time = self.__clock.tick(60)  # 60 fps = 1000 / 60 = 16 msecs
-            self.__process_events()
-            self.__update(delta_time)
-            self.__render()
+        state_manager = self.__state_manager
+        tick = self.__clock.tick
+        wait_for_event = self.__wait_for_event
+        process_events = self.__process_events
+        update = self.__update
+        render = self.__render
+
+        while self.__running:
+            is_animated = state_manager.is_animated
+            waited_event = None if is_animated else wait_for_event()
+            delta_time = tick(FPS)  # 60 fps = 1000 / 60 = 16 msecs
+            has_events = process_events(waited_event)
+            update(delta_time)
+            if is_animated or has_events:
+                render()
 
         self.__release()
 
@@ -71,43 +102,72 @@ class App:
         return self.__running
 
     def __initialise_screen(self) -> pygame.Surface:
-        """Initialises the game window with the screen size, resizable, and 32-bit color (with transparency)."""
+        """Initialises the game window with the screen size, resizable, and 32-bit color (with transparency).
+
+        The screen is `SCALED`, so SDL renders it through a hardware texture with a fixed internal resolution
+        and resizing the window only scales the output. Vsync is requested, but not every driver supports it.
+        """
 
         logger.info("Setting up game window...")
-        flags = RESIZABLE | DOUBLEBUF  # FULLSCREEN | DOUBLEBUF
+        flags = SCALED | RESIZABLE | DOUBLEBUF  # FULLSCREEN | DOUBLEBUF
         resolution = get_cfg("game", "screen_size")
-        screen = pygame.display.set_mode(resolution, flags, 32)
+        try:
+            screen = pygame.display.set_mode(resolution, flags, 32, vsync=1)
+        except pygame.error as e:
+            logger.warning(f"Vsync not available ({e}), using the frame limiter only.")
+            screen = pygame.display.set_mode(resolution, flags, 32)
         pygame.display.set_caption(GAME_NAME)  # Set the window title
         pygame.mouse.set_visible(False)
-        os.environ[SCREEN_WIDTH_ENV_VAR] = str(resolution[0])
-        os.environ[SCREEN_HEIGHT_ENV_VAR] = str(resolution[1])
         return screen
 
-    def __process_events(self) -> None:
+    def __wait_for_event(self) -> Event | None:
+        """Sleeps until an event is available or a frame period has elapsed.
+
+        Returns:
+            The received event, to be handled by `__process_events` before the rest of the queue, or `None` if
+            no event arrived in time.
+        """
+
+        event = pygame.event.wait(FRAME_PERIOD)
+        return event if event.type != NOEVENT else None
+
+    def __process_events(self, waited_event: Event | None = None) -> bool:
         """Handles all events captured from the Pygame event queue.
 
         This includes checking for the quitting events to stop the game, and passing other events
-        to the state manager for further processing.
+        to the state manager for further processing. Only the event types allowed in `__init__` are
+        queued by SDL, so the queue is drained with a single call per frame.
+
+        Args:
+            waited_event: the event already taken from the queue by `__wait_for_event`, if any. It is
+                handled first, since it arrived before the events still in the queue.
+
+        Returns:
+            `True` if any event was processed, `False` otherwise.
         """
 
-        for event in pygame.event.get():
-            self.__handle_quit_event(event)
-            self.__handle_resize_event(event)
+        events = pygame.event.get()
+        if waited_event is not None:
+            events.insert(0, waited_event)
+        for event in events:
+            if event.type == QUIT or (event.type == KEYDOWN and event.key == K_ESCAPE):
+                self.__running = False
             self.__state_manager.process_events(event)
+            self.__handle_window_change(event)
             self.__handle_background_color(event)
+        return bool(events)
+
+    def __handle_window_change(self, event: Event) -> None:
+        """Schedules a redraw of the whole screen when the window is resized or exposed.
 
-    def __handle_resize_event(self, event: Event) -> None:
-        if event.type == VIDEORESIZE:
-            screen_size = event.size
-            logger.debug(f"Resizing screen to: {screen_size}")
-            set_cfg("game", "screen_size", value=screen_size)
-            os.environ[SCREEN_WIDTH_ENV_VAR] = str(screen_size[0])
-            os.environ[SCREEN_HEIGHT_ENV_VAR] = str(screen_size[1])
-            self.__starfield = self.__generate_starfield()
-            self.__draw_starfield()
+        Args:
+            event: a Pygame event to be handled.
+        """
+        if event.type in (VIDEORESIZE, VIDEOEXPOSE):
+            self.__full_update = True
 
     def __handle_background_color(self, event: Event) -> None:
-        """Handles the gameover event to stop the game.
+        """Changes the background colour when the intro or the gameover state is entered.
 
         Args:
             event: a Pygame event to be handled.
@@ -115,17 +175,12 @@ class App:
         if event.type == USEREVENT:
             if event.event == Events.INTRO:
                 self.__background_colour = event.color
+                self.__background = self.__render_background()
+                self.__full_update = True
             if event.event == Events.GAMEOVER:
                 self.__background_colour = event.color
-
-    def __handle_quit_event(self, event: Event) -> None:
-        """Handles events to stop the game.
-
-        Args:
-            event: a Pygame event to be handled.
-        """
-        if event.type != QUIT and event.type == KEYDOWN and event.key == K_ESCAPE or event.type == QUIT:
-            self.__running = False
+                self.__background = self.__render_background()
+                self.__full_update = True
 
     def __update(self, delta_time: int) -> None:
         """Updates the game objects.
@@ -141,21 +196,36 @@ class App:
     def __render(self) -> None:
         """Renders the current game state.
 
-        Fills the screen with black, then calls the render method of the state manager, and finally
-        updates the display.
+        Clears the screen with the pre-rendered background, then calls the render method of the state
+        manager, and finally updates the display. Only the areas drawn in the previous frame are cleared,
+        and only those and the ones drawn in this frame are sent to the display, unless a full update is
+        required.
         """
 
-        self.__screen.fill(self.__background_colour)
-        self.__draw_starfield()
-        self.__state_manager.render(self.__screen)
-        pygame.display.update()
+        full_update = self.__full_update or self.__state_manager.needs_full_redraw
+        if full_update:
+            self.__screen.blit(self.__background, (0, 0))
+        else:
+            self.__screen.blits([(self.__background, rect, rect) for rect in self.__dirty_rects], doreturn=False)
+
+        dirty_rects = self.__state_manager.render(self.__screen)
+
+        if dirty_rects is None or full_update:
+            pygame.display.update()
+            self.__full_update = False
+        else:
+            pygame.display.update(self.__dirty_rects + dirty_rects)
+        # The areas drawn in a full update frame must be cleared in the next one as well
+        self.__dirty_rects = dirty_rects or []
 
-    def __draw_starfield(self) -> None:
-        """Draws the starfield background for the game."""
+    def __render_background(self) -> Surface:
+        """Renders the background colour and the starfield to a surface matching the screen format."""
 
-        for star in self.__starfield:
-            x, y, color = star
-            pygame.draw.circle(self.__screen, (color, color, color), (x, y), 1)
+        background = Surface(self.__screen.get_size()).convert()
+        background.fill(self.__background_colour)
+        for x, y, color in self.__starfield:
+            pygame.draw.circle(background, color, (x, y), 1)
+        return background
 
     def __release(self) -> None:
         """Cleans up resources.
@@ -167,7 +237,7 @@ class App:
         pygame.quit()
         logger.info("Game stopped.")
 
-    def __generate_starfield(self) -> list[tuple[int, int, int]]:
+    def __generate_starfield(self) -> list[tuple[int, int, tuple[int, int, int]]]:
         """Generates a starfield background for the game."""
 
         stars = []
@@ -175,5 +245,6 @@ class App:
         for _ in range(num_stars):
             x = randint(0, self.__screen.get_width())
             y = randint(0, self.__screen.get_height())
-            stars.append((x, y, randint(50, 255)))
+            grey = randint(50, 255)
+            stars.append((x, y, (grey, grey, grey)))
         return stars
@@ -1,5 +1,6 @@
 """Module for helper methods and utilities for fonts."""
 
+from functools import lru_cache
 from importlib import resources
 
 from pygame import Surface
@@ -8,9 +9,12 @@ from pygame.font import Font
 from spycewar.constants import SPYCEWAR_BLUE
 
 
+@lru_cache
 def initialise_font(filename: str, size: int) -> Font:
     """Initialises a font from the given filename and size.
 
+    Fonts are cached, so each font file and size is only resolved and loaded once.
+
     Args:
         filename: the name of the font file to load (e.g. "microgramma.ttf").
         size: the size of the font to render.
@@ -10,7 +10,9 @@ from pygame import Surface
 
 
 def load_image(file_path: Path | Traversable) -> Surface:
-    """Loads the player image from the given file path and converts it to alpha.
+    """Loads the image from the given file path and converts it to the display pixel format with alpha.
+
+    The display mode must be set before calling this function, otherwise the conversion fails.
 
     Args:
         file_path: The path of the image file.
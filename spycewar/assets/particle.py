@@ -1,8 +1,8 @@
 """Module for rendering a particle in the game."""
 
-import os
 from functools import cached_property
 from random import choice, uniform
+from typing import ClassVar
 
 from pygame import Surface
 from pygame.draw import circle
@@ -10,27 +10,30 @@ from pygame.math import Vector2
 from pygame.sprite import Group, Sprite
 
 from spycewar.config import get_cfg
-from spycewar.constants import SCREEN_HEIGHT_ENV_VAR, SCREEN_WIDTH_ENV_VAR
 
 
 class Particle(Sprite):
     """Particle class to represent an explosion particle in the game."""
 
     __alpha = 255
+    __palette = ((69, 177, 200), (80, 175, 220), (60, 165, 195), (50, 155, 185), (90, 180, 230))
+    __surfaces: ClassVar[dict[tuple[tuple[int, int, int], int], Surface]] = {}
+    __screen_size: ClassVar[tuple[int, int] | None] = None
 
     def __init__(self, groups: Group, position: Vector2, direction: Vector2, radius: int, fade: float = 0.1) -> None:
         super().__init__(groups)
         self.__position = position.xy
-        self.__direction = direction
+        self.__velocity_x, self.__velocity_y = direction.x * self.speed, direction.y * self.speed
         self.__radius = radius
         self.__fade_rate = fade
+        self.__screen_width, self.__screen_height = self.__get_screen_size()
         self.__create_surface()
 
-    @property
+    @cached_property
     def color(self) -> tuple[int, int, int]:
         """Returns the color of the particle."""
 
-        return choice([(69, 177, 200), (80, 175, 220), (60, 165, 195), (50, 155, 185), (90, 180, 230)])
+        return choice(self.__palette)
 
     @cached_property
     def speed(self) -> float:
@@ -51,49 +54,50 @@ class Particle(Sprite):
         return self.__fade_rate
 
     def update(self, delta_time: int) -> None:
-        """Updates the particle's position based on the direction and speed."""
-
-        self.__move(delta_time)
-        self.__fade(delta_time)
-        self.__check_alpha()
-        self.__check_position()
+        """Updates the particle's position based on the direction and speed.
 
-    def __create_surface(self) -> None:
-        """Creates a surface for the particle."""
-
-        self.image = Surface((4, 4)).convert_alpha()
-        self.image.set_colorkey("black")
-        circle(surface=self.image, color=self.color, center=(2, 2), radius=self.__radius)
-        self.rect = self.image.get_rect(center=self.__position)
+        The particle is moved, faded and removed if it is transparent or off-screen in a single pass, using
+        scalar arithmetic on the velocity computed when the particle was created.
+        """
 
-    def __move(self, delta_time: float) -> None:
-        """Moves the particle based on the direction and speed."""
+        position = self.__position
+        position.x += self.__velocity_x * delta_time
+        position.y += self.__velocity_y * delta_time
+        self.rect.center = position
 
-        self.__position += self.__direction * self.speed * delta_time
-        self.rect.center = self.__position
+        if fade := round(self.__fade_rate * delta_time):
+            self.__alpha -= fade
+            if self.__alpha <= 0:
+                self.kill()
+                return
+            self.image.set_alpha(self.__alpha)
 
-    def __fade(self, delta_time: float) -> None:
-        """Fades the particle over time."""
+        if not (0 <= position.x <= self.__screen_width and 0 <= position.y <= self.__screen_height):
+            self.kill()
 
-        self.__alpha -= round(self.fade_rate * delta_time)
-        self.image.set_alpha(self.alpha)
+    @classmethod
+    def __get_screen_size(cls) -> tuple[int, int]:
+        """Returns the screen size, read when the first particle is created and shared afterwards."""
 
-    def __check_alpha(self) -> None:
-        """Checks if the particle is transparent and removes it if it is."""
+        if cls.__screen_size is None:
+            screen_width, screen_height = get_cfg("game", "screen_size")
+            cls.__screen_size = screen_width, screen_height
+        return cls.__screen_size
 
-        if self.alpha <= 0:
-            self.kill()
+    def __create_surface(self) -> None:
+        """Creates a surface for the particle.
 
-    def __check_position(self) -> None:
-        """Checks if the particle is off-screen and removes it if it is."""
+        The circle for each color and radius is drawn once and shared; every particle gets its own copy so
+        that it can fade independently. The surface is opaque with a color key, so fading uses the cheaper
+        surface alpha instead of per-pixel alpha blending.
+        """
 
-        screen_width = os.environ.get(SCREEN_WIDTH_ENV_VAR) or get_cfg("game", "screen_size")[0]
-        screen_height = os.environ.get(SCREEN_HEIGHT_ENV_VAR) or get_cfg("game", "screen_size")[1]
+        key = (self.color, self.__radius)
+        if (surface := self.__surfaces.get(key)) is None:
+            surface = Surface((4, 4)).convert()
+            surface.set_colorkey("black")
+            circle(surface=surface, color=self.color, center=(2, 2), radius=self.__radius)
+            self.__surfaces[key] = surface
 
-        if (
-            self.rect.centerx < 0
-            or self.rect.centerx > int(screen_width)
-            or self.rect.centery < 0
-            or self.rect.centery > int(screen_height)
-        ):
-            self.kill()
+        self.image = surface.copy()
+        self.rect = self.image.get_rect(center=self.__position)
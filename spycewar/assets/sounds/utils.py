@@ -1,4 +1,4 @@
-"""Module for helper methods and utilities for images."""
+"""Module for helper methods and utilities for sounds."""
 
 from importlib import resources
 from importlib.abc import Traversable
@@ -6,10 +6,9 @@ from pathlib import Path
 
 import pygame
 from loguru import logger
-from pygame import Surface
 
 
-def load_music(file_path: Path | Traversable) -> Surface:
+def load_music(file_path: Path | Traversable) -> None:
     """Loads the music from the given file path.
 
     Args:
@@ -111,11 +111,13 @@ class Config:
     def data(self, values: dict) -> None:
         """Set the configuration settings."""
 
+        get_cfg.cache_clear()
         self.__settings = values
 
     def reload(self) -> None:
         """Reload the configuration from the file."""
 
+        get_cfg.cache_clear()
         self.__load_config()
 
     def __get_internal_path(self) -> Path:
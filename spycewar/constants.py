@@ -2,6 +2,7 @@
 
 GAME_NAME = "SPYCEWAR!"
 GAME_OVER = "GAME OVER"
-SCREEN_WIDTH_ENV_VAR = "SPYWARE_SCREEN_WIDTH"
-SCREEN_HEIGHT_ENV_VAR = "SPYWARE_SCREEN_HEIGHT"
+FPS = 60
+FRAME_PERIOD = 1000 // FPS  # Whole milliseconds, as the event timeouts require
+FRAME_DURATION = 1000 / FPS  # Exact duration of a frame in milliseconds
 SPYCEWAR_BLUE = (78, 216, 253)
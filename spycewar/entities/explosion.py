@@ -3,7 +3,7 @@
 from random import uniform
 
 import pygame
-from pygame import Surface
+from pygame import Rect, Surface
 from pygame.event import Event
 from pygame.locals import USEREVENT
 from pygame.math import Vector2
@@ -38,10 +38,11 @@ class Explosion(GameObject):
             kill_event = Event(USEREVENT, event=Events.EXPLOSION_OVER, explosion=self)
             pygame.event.post(kill_event)
 
-    def render(self, surface_dst: Surface) -> None:
+    def render(self, surface_dst: Surface) -> Rect | None:
         """Renders the explosion entity."""
 
-        self.particle_group.draw(surface_dst)
+        rects = surface_dst.blits([(particle.image, particle.rect) for particle in self.particle_group])
+        return rects[0].unionall(rects[1:]) if rects else None
 
     def release(self) -> None:
         """Releases the resources for the explosion entity."""
@@ -26,8 +26,8 @@ class GameObject(Sprite, ABC):
             Abstract, updates the game object for a period of time.
         release():
             Abstract, releases any resource from the game object.
-        _in_bounds(distance):
-            Checks if game object is inside the screen.
+        _in_bounds(x, y):
+            Checks if a position is inside the screen.
     """
 
     def __init__(self) -> None:
@@ -36,6 +36,7 @@ class GameObject(Sprite, ABC):
         super().__init__()
         self._position = Vector2(0.0, 0.0)
         self.rect = Rect(0, 0, 0, 0)
+        self.__screen_width, self.__screen_height = get_cfg("game", "screen_size")
 
     @abstractmethod
     def handle_input(self, key: int, is_pressed: bool) -> None:
@@ -66,8 +67,12 @@ class GameObject(Sprite, ABC):
         """
 
     @abstractmethod
-    def render(self, surface_dst: Surface) -> None:
-        """Renders the game object to the screen."""
+    def render(self, surface_dst: Surface) -> Rect | None:
+        """Renders the game object to the screen.
+
+        Returns:
+            The area of the surface that has been drawn, or `None` if nothing has been drawn.
+        """
 
     @abstractmethod
     def release(self) -> None:
@@ -79,19 +84,20 @@ class GameObject(Sprite, ABC):
 
         return self._position
 
-    def _in_bounds(self, distance: Vector2) -> bool:
-        """Checks if the game object is inside the screen.
+    def _in_bounds(self, x: float, y: float) -> bool:
+        """Checks if the given position is inside the screen.
+
+        The screen size is read once when the game object is created, so it is not looked up for every check.
 
         Args:
-            distance: the distance to check if the game object is inside the screen.
+            x: the horizontal coordinate to check.
+            y: the vertical coordinate to check.
 
         Returns:
-            `True` if the game object is inside the screen, `False` otherwise.
+            `True` if the position is inside the screen, `False` otherwise.
         """
-        new_pos = self._position + distance
-        width, height = get_cfg("game", "screen_size")
 
-        return new_pos.x >= 0 and new_pos.x <= width and new_pos.y >= 0 and new_pos.y <= height
+        return 0 <= x <= self.__screen_width and 0 <= y <= self.__screen_height
 
     def _is_alive(self) -> bool:
         """Checks if the game object is alive.
@@ -1,6 +1,6 @@
 """Module for the health bar of the players."""
 
-from pygame import Surface
+from pygame import Rect, Surface
 from pygame.draw import rect
 from pygame.event import Event
 
@@ -26,6 +26,9 @@ class HealthBar(GameObject):
         self.__max_hp = get_cfg("entities", "players", player_id.value, "max_health")
         self.__hp = self.__max_hp
         self.__font = initialise_font("eurostile.ttf", 12)
+        self.__label = self.__font.render(self.player_id.name, True, (0, 0, 0))
+        self.__bar_surface = Surface((self.__width, self.__height)).convert()
+        self.__render_bar()
 
     @property
     def ratio(self) -> float:
@@ -39,23 +42,33 @@ class HealthBar(GameObject):
     def process_events(self, event: Event) -> None:
         if event.event == Events.PLAYER_HIT and event.player.state.player_id == self.player_id:
             self.__hp = event.player.state.health
+            self.__render_bar()
 
         if event.event == Events.HEALTH_POWERUP_PICKUP and event.player.state.player_id == self.player_id:
             self.__hp = event.player.state.health
+            self.__render_bar()
 
     def update(self, delta_time: float) -> None:
         """Update the health bar."""
 
-    def render(self, surface_dst: Surface) -> None:
+    def render(self, surface_dst: Surface) -> Rect:
         """Render the health bar on the screen.
 
         Args:
             surface_dst: the surface to render the health bar on.
+
+        Returns:
+            The area of the surface covered by the bar and its label.
         """
-        color = (220, 220, 220) if self.ratio > 0.2 else ("red")
-        rect(surface_dst, self.__empty_color, (self.__x, self.__y, self.__width, self.__height))
-        rect(surface_dst, color, (self.__x + 1, self.__y + 1, self.__width * self.ratio - 2, self.__height - 2))
-        surface_dst.blit(self.__font.render(f"{self.player_id.name}", True, (0, 0, 0)), (self.__x + 5, self.__y + 2))
+        return surface_dst.blit(self.__bar_surface, (self.__x, self.__y))
 
     def release(self) -> None:
         """Release the health bar."""
+
+    def __render_bar(self) -> None:
+        """Draws the bar and its label to the cached surface, which only changes when the health changes."""
+
+        color = (220, 220, 220) if self.ratio > 0.2 else ("red")
+        self.__bar_surface.fill(self.__empty_color)
+        rect(self.__bar_surface, color, (1, 1, self.__width * self.ratio - 2, self.__height - 2))
+        self.__bar_surface.blit(self.__label, (5, 2))
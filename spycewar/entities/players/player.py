@@ -3,16 +3,18 @@
 import math
 from functools import cached_property
 from random import randint
+from typing import cast
 
 import pygame
 from loguru import logger
-from pygame import Surface
+from pygame import Rect, Surface
 from pygame.event import Event
 from pygame.locals import USEREVENT
 from pygame.math import Vector2
 
 from spycewar.assets.fonts.utils import initialise_font, render_text
 from spycewar.config import get_cfg
+from spycewar.constants import FRAME_DURATION
 from spycewar.entities.game_object import GameObject
 from spycewar.entities.players.controls import PlayerControls
 from spycewar.entities.players.enums import PlayerId
@@ -30,6 +32,8 @@ class Player(GameObject):
 
     Attributes:
         player: the player id of the player object.
+        image: the image of the player's ship.
+        max_speed: the maximum speed of the ship.
         state: the state of the player object.
         specs: the specifications of the player object.
         controls: the controls of the player object.
@@ -45,15 +49,34 @@ class Player(GameObject):
         self.__ship_state = ShipState()
         self.__specs = ShipSpecs.load_ship_specs(player)
         self.__controls = PlayerControls.load_controls(player)
+        self.image = self.__specs.image
+        self.max_speed = self.__specs.max_speed
+        self.__max_squared_speed = self.max_speed * self.max_speed
+        # Rotation and acceleration are configured per frame, so they are scaled to milliseconds
+        self.__rotation_speed = self.__specs.rotation_speed / FRAME_DURATION
+        self.__acceleration = self.__specs.acceleration / FRAME_DURATION
 
         # Cooldown
         self.__cooldown = 0.0
         self.__hyperspace_cooldown = 0.0
 
         # Caches
+        self.__rotation_cache = self.__specs.rotated_images
+        self.__mask_cache = self.__specs.rotated_masks
         self.__rotated_image = self.image  # Cache the rotated image
+        self.__rotated_mask = self.__mask_cache[0]  # Cache the mask of the rotated image
         self.__last_angle = self.__ship_state.angle
-
+        self.__direction_angle: float | None = None  # Angle of the cached heading
+        self.__direction = (0.0, 0.0)  # Cache the heading unit vector
+        self.__font = initialise_font("eurostile.ttf", 14)
+        self.__info_cache: dict[int, tuple[str, Surface]] = {}  # Cache the rendered debug lines
+        self.__debug_mode = get_cfg("game", "debug_mode")
+        self.__screen_size = get_cfg("game", "screen_size")
+        self.__half_height = self.image.get_height() // 2
+        # The ship rotates around its centre, so this circle encloses it at any angle
+        self.radius = math.hypot(*self.image.get_size()) / 2
+
+        self.__spawn()
         logger.info(f"{player} created with specs: {self.__specs}")
 
         self.__get_mask()
@@ -67,18 +90,6 @@ class Player(GameObject):
 
         return self.state.player_id
 
-    @cached_property
-    def image(self) -> Surface:
-        """Image of the player."""
-
-        return self.__specs.image
-
-    @cached_property
-    def max_speed(self) -> float:
-        """Maximum speed of the ship."""
-
-        return self.__specs.max_speed
-
     @property
     def cooldown(self) -> float:
         """Cooldown time between shots."""
@@ -158,40 +169,43 @@ class Player(GameObject):
         Velocity is a vector quantity that describes the rate of change of position of an object. It is defined by both
         a magnitude (the speed) and a direction.
 
+        The speed (the length of the velocity) is not stored, since it is only needed for the debug information.
+
+        Rotation and acceleration are scaled by the time passed, like the position, so the ship handles the same
+        regardless of the frame rate.
+
         Args:
             delta_time: the time passed since the last frame.
         """
-        if not self._position:
-            return
-
-        if self.__ship_state.is_accelerating:
-            self.__update_velocity()
+        ship_state = self.__ship_state
+        if ship_state.is_accelerating:
+            self.__update_velocity(delta_time)
             self.__thrust()
-        if self.__ship_state.is_turning_left:
-            self.__ship_state.angle += self.__specs.rotation_speed
-        if self.__ship_state.is_turning_right:
-            self.__ship_state.angle -= self.__specs.rotation_speed
+        ship_state.angle += (
+            self.__rotation_speed * delta_time * (ship_state.is_turning_left - ship_state.is_turning_right)
+        )
 
-        if self.__ship_state.is_shield_enabled and self.state.shield > 0:
+        if ship_state.is_shield_enabled and self.state.shield > 0:
             self.__shield(delta_time)
 
-        self._position += self.__ship_state.velocity * delta_time
-        self.__ship_state.speed = self.__ship_state.velocity.length()
+        velocity = ship_state.velocity
+        self._position.x += velocity.x * delta_time
+        self._position.y += velocity.y * delta_time
 
-        if self.cooldown >= 0.0:
-            self.cooldown -= delta_time
+        if self.__cooldown > 0.0:
+            self.__cooldown = max(self.__cooldown - delta_time, 0.0)
 
-        if self.hyperspace_cooldown >= 0.0:
-            self.hyperspace_cooldown -= delta_time
+        if self.__hyperspace_cooldown > 0.0:
+            self.__hyperspace_cooldown = max(self.__hyperspace_cooldown - delta_time, 0.0)
 
         self.__get_mask()
 
         if self.state.health <= 0:
-            logger.debug(f"{self} died.")
+            logger.debug("{} died.", self)
             dead_event = Event(USEREVENT, event=Events.PLAYER_DIED, player=self)
             pygame.event.post(dead_event)
 
-    def render(self, surface_dst: Surface) -> None:
+    def render(self, surface_dst: Surface) -> Rect:
         """Renders the player to the given surface at the player's position.
 
         It rotates always the original image to the current angle to avoid distortion.
@@ -200,105 +214,129 @@ class Player(GameObject):
 
         Args:
             surface_dst: The surface to render the player to.
-        """
-        if not self._position:
-            if get_cfg("entities", "players", "random_start_position"):
-                self._position = Vector2(
-                    randint(20, surface_dst.get_width() - 20),
-                    randint(20, surface_dst.get_height()) - 20,
-                )
-            elif self.state.player_id == PlayerId.PLAYER1:
-                self._position = Vector2(100, 100)
-                self.__ship_state.angle = 180
-            elif self.state.player_id == PlayerId.PLAYER2:
-                self._position = Vector2(surface_dst.get_width() - 100, surface_dst.get_height() - 100)
 
+        Returns:
+            The area of the surface drawn by the player (ship, shield and debug information).
+        """
         self.__normalise_angle()
         self.__rotate_image()
-        self.__wrap_position(surface_dst)
+        self.__wrap_position()
 
-        image_rect = self.__rotated_image.get_rect(center=self._position)
-        surface_dst.blit(self.__rotated_image, image_rect)
+        self.rect = self.__rotated_image.get_rect(center=self._position)
+        dirty_rect = surface_dst.blit(self.__rotated_image, self.rect)
 
         if self.__ship_state.is_shield_enabled and self.state.shield > 0:
-            pygame.draw.circle(surface_dst, (0, 0, 200), self._position, self.image.get_height() // 2, 2)
+            shield_rect = pygame.draw.circle(surface_dst, (0, 0, 200), self._position, self.__half_height, 2)
+            dirty_rect.union_ip(shield_rect)
 
-        if get_cfg("game", "debug_mode"):
-            self.__render_player_info(surface_dst)
-            pygame.draw.rect(surface_dst, (255, 0, 0), self.rect, 1)
+        if self.__debug_mode:
+            dirty_rect.union_ip(self.__render_player_info(surface_dst))
+            dirty_rect.union_ip(pygame.draw.rect(surface_dst, (255, 0, 0), self.rect, 1))
+
+        return dirty_rect
 
     def release(self) -> None:
         """Releases the player object and its resources."""
 
+    def __spawn(self) -> None:
+        """Places the player at its starting position, either fixed or random depending on the configuration."""
+
+        width, height = self.__screen_size
+        if get_cfg("entities", "players", "random_start_position"):
+            self._position = Vector2(randint(20, width - 20), randint(20, height - 20))
+        elif self.state.player_id == PlayerId.PLAYER1:
+            self._position = Vector2(100, 100)
+            self.__ship_state.angle = 180
+        elif self.state.player_id == PlayerId.PLAYER2:
+            self._position = Vector2(width - 100, height - 100)
+
     def __get_mask(self) -> None:
-        """Gets the mask of the player's image."""
+        """Gets the mask of the player's image, precomputed along with the rotated image."""
 
-        self.rect = self.__rotated_image.get_rect()
-        self.rect.topleft = self._position.x - self.rect.width // 2, self._position.y - self.rect.height // 2
-        self.mask = pygame.mask.from_surface(self.__rotated_image)
+        self.rect = self.__rotated_image.get_rect(center=self._position)
+        self.mask = self.__rotated_mask
 
-    def __render_player_info(self, surface_dst: Surface) -> None:
+    def __render_player_info(self, surface_dst: Surface) -> Rect:
         """Renders the player's information to the given surface for debugging purposes.
 
         Args:
             surface_dst: The surface to render the player's information to.
+
+        Returns:
+            The area of the surface covered by the information.
         """
 
         x = 10 if self.state.player_id == PlayerId.PLAYER1 else surface_dst.get_width() - 250
 
-        font = initialise_font("eurostile.ttf", 14)
-        surface_dst.blit(render_text(font, f"Speed: {self.__ship_state.speed:.2f}"), (x, 30))
-        surface_dst.blit(render_text(font, f"Angle: {self.__ship_state.angle:.2f}"), (x, 50))
-        surface_dst.blit(render_text(font, f"Cooldown: {self.cooldown:.2f}"), (x, 70))
-        surface_dst.blit(render_text(font, f"Position: {self._position}"), (x, 90))
-        surface_dst.blit(render_text(font, f"Velocity: {self.__ship_state.velocity}"), (x, 110))
-        surface_dst.blit(render_text(font, f"Rect: {self.rect}"), (x, 130))
-        surface_dst.blit(render_text(font, f"Health: {self.state.health}"), (x, 150))
-        surface_dst.blit(render_text(font, f"hyperspace Cooldown: {self.hyperspace_cooldown:.2f}"), (x, 170))
-        surface_dst.blit(render_text(font, f"Shielded: {self.state.shield}"), (x, 190))
+        lines = [
+            f"Speed: {self.__ship_state.velocity.length():.2f}",
+            f"Angle: {self.__ship_state.angle:.2f}",
+            f"Cooldown: {self.cooldown:.2f}",
+            f"Position: {self._position}",
+            f"Velocity: {self.__ship_state.velocity}",
+            f"Rect: {self.rect}",
+            f"Health: {self.state.health}",
+            f"hyperspace Cooldown: {self.hyperspace_cooldown:.2f}",
+            f"Shielded: {self.state.shield}",
+        ]
+        # The rects are always returned with `doreturn`
+        rects = cast(
+            list[Rect],
+            surface_dst.blits(
+                [(self.__render_info_line(i, line), (x, 30 + 20 * i)) for i, line in enumerate(lines)],
+                doreturn=True,
+            ),
+        )
+        return rects[0].unionall(rects[1:])
 
-    def __wrap_position(self, surface_dst: Surface) -> None:
-        """Wraps the player's position around the screen if it goes out of bounds.
+    def __render_info_line(self, index: int, text: str) -> Surface:
+        """Renders a line of the player's debug information, reusing the last render if the text has not changed.
 
         Args:
-            surface_dst: The surface to wrap the player around.
+            index: the position of the line in the debug information.
+            text: the text of the line.
+
+        Returns:
+            The rendered text.
         """
-        if not self._position:
-            return
-
-        if self._position.x > surface_dst.get_width():
-            self._position.x = 0
-        elif self._position.x < 0:
-            self._position.x = surface_dst.get_width()
-        if self._position.y > surface_dst.get_height():
-            self._position.y = 0
-        elif self._position.y < 0:
-            self._position.y = surface_dst.get_height()
+
+        cached_text, cached_surface = self.__info_cache.get(index, ("", None))
+        if cached_surface is None or cached_text != text:
+            cached_surface = render_text(self.__font, text)
+            self.__info_cache[index] = (text, cached_surface)
+        return cached_surface
+
+    def __wrap_position(self) -> None:
+        """Wraps the player's position around the screen if it goes out of bounds."""
+        width, height = self.__screen_size
+        self._position.x %= width
+        self._position.y %= height
 
     def __rotate_image(self) -> None:
-        """Rotates the player image to the current angle if it has changed since the last frame."""
+        """Rotates the player image to the current angle if it has changed since the last frame.
+
+        The rotated images and their masks are precomputed for every degree, so the angle is quantised to the closest
+        lower degree.
+        """
 
         if self.__last_angle != self.__ship_state.angle:
-            self.__rotated_image = pygame.transform.rotate(self.image, self.__ship_state.angle)
+            index = int(self.__ship_state.angle) % 360
+            self.__rotated_image = self.__rotation_cache[index]
+            self.__rotated_mask = self.__mask_cache[index]
             self.__last_angle = self.__ship_state.angle
 
     def __normalise_angle(self) -> None:
         """Normalises the angle to be between 0 and 360 degrees."""
 
-        if self.__ship_state.angle > 360:
-            self.__ship_state.angle -= 360
-        elif self.__ship_state.angle < 0:
-            self.__ship_state.angle += 360
+        self.__ship_state.angle %= 360
 
     def __hyperspace(self) -> None:
         """Hyperspaces the player to a random position on the screen."""
 
         self.hyperspace_cooldown = self.__specs.hyperspace_cooldown
         self.__ship_state.velocity = Vector2(0, 0)
-        self._position = Vector2(
-            randint(20, get_cfg("game", "screen_size")[0] - 20),
-            randint(20, get_cfg("game", "screen_size")[1] - 20),
-        )
+        width, height = self.__screen_size
+        self._position = Vector2(randint(20, width - 20), randint(20, height - 20))
 
     def __fire(self) -> None:
         """Fires a projectile from the player's position.
@@ -315,7 +353,8 @@ class Player(GameObject):
         """Applies full thrust to the player's velocity."""
 
         velocity, position = self.__compute_trajectory(backwards=True, offset=-5, speed=2.5)
-        thrust_event = Event(USEREVENT, event=Events.THRUST, pos=position, dir_=2 * velocity)
+        velocity *= 2  # The trajectory is computed for this event only, so it is scaled in place
+        thrust_event = Event(USEREVENT, event=Events.THRUST, pos=position, dir_=velocity)
         pygame.event.post(thrust_event)
 
     def __shield(self, delta_time: float) -> None:
@@ -335,22 +374,46 @@ class Player(GameObject):
         Returns:
             The velocity and position of the object.
         """
-        angle_radians = math.radians(self.__ship_state.angle)
-        direction_vector = -Vector2(math.sin(angle_radians), math.cos(angle_radians))
-        direction_vector = -direction_vector if backwards else direction_vector
-        velocity = self.__ship_state.velocity + direction_vector * speed
-        position = direction_vector * (self.image.get_height() // 2 + offset) + self._position
+        direction_x, direction_y = self.__get_direction()
+        if backwards:
+            direction_x, direction_y = -direction_x, -direction_y
+
+        distance = self.__half_height + offset
+        ship_velocity = self.__ship_state.velocity
+        velocity = Vector2(ship_velocity.x + direction_x * speed, ship_velocity.y + direction_y * speed)
+        position = Vector2(self._position.x + direction_x * distance, self._position.y + direction_y * distance)
         return velocity, position
 
-    def __update_velocity(self) -> None:
+    def __get_direction(self) -> tuple[float, float]:
+        """Returns the unit vector the ship is heading to, only recomputed when the angle changes.
+
+        Returns:
+            The x and y components of the heading.
+        """
+
+        if self.__direction_angle != self.__ship_state.angle:
+            angle_radians = math.radians(self.__ship_state.angle)
+            self.__direction = (-math.sin(angle_radians), -math.cos(angle_radians))
+            self.__direction_angle = self.__ship_state.angle
+        return self.__direction
+
+    def __update_velocity(self, delta_time: float) -> None:
         """Updates the player's velocity based on the current angle and acceleration.
 
         Speed should be limited to the maximum speed, and the acceleration vector should be rotated
         to match the angle.
+
+        The velocity is updated in place with scalar arithmetic, so no intermediate vectors are allocated per frame.
+
+        Args:
+            delta_time: the time passed since the last frame.
         """
-        acceleration_vector = Vector2(self.__specs.acceleration, 0)
-        acceleration_vector.rotate_ip(-self.__ship_state.angle - 90)
-        velocity = self.__ship_state.velocity + acceleration_vector
-        self.__ship_state.velocity = (
-            velocity if velocity.length() <= self.max_speed else velocity.normalize() * self.max_speed
-        )
+        direction_x, direction_y = self.__get_direction()
+        velocity = self.__ship_state.velocity
+        acceleration = self.__acceleration * delta_time
+        velocity.x += acceleration * direction_x
+        velocity.y += acceleration * direction_y
+
+        squared_speed = velocity.x * velocity.x + velocity.y * velocity.y
+        if squared_speed > self.__max_squared_speed:
+            velocity *= self.max_speed / math.sqrt(squared_speed)
@@ -30,7 +30,7 @@ class PlayerState:
     def health(self, value: int) -> None:
         """Set the health of the player."""
 
-        self.__health = max(0, min(self.__max_health, value))
+        self.__health = self.__clamp(value, self.__max_health)
 
     @property
     def shield(self) -> int:
@@ -42,7 +42,7 @@ class PlayerState:
     def shield(self, value: int) -> None:
         """Set the shield of the player."""
 
-        self.__shield = max(0, min(self.__max_shield, value))
+        self.__shield = self.__clamp(value, self.__max_shield)
 
     def __init__(self, player_id: PlayerId):
         self.player_id = player_id
@@ -71,4 +71,18 @@ class PlayerState:
         Intended for power-ups.
         """
 
-        self.__health = min(self.__max_health, self.__health + amount)
+        self.__health = self.__clamp(self.__health + amount, self.__max_health)
+
+    @staticmethod
+    def __clamp(value: int, maximum: int) -> int:
+        """Clamps the value between zero and the given maximum.
+
+        Args:
+            value: the value to clamp.
+            maximum: the upper bound of the value.
+
+        Returns:
+            The clamped value.
+        """
+
+        return 0 if value < 0 else maximum if value > maximum else value
@@ -1,14 +1,14 @@
 """Module for powerups."""
 
-import os
 import random
 from importlib import resources
 
 import pygame
 from loguru import logger
-from pygame import Surface, Vector2
+from pygame import Rect, Surface, Vector2
 from pygame.event import Event
 from pygame.locals import USEREVENT
+from pygame.mask import Mask
 
 from spycewar.assets.images.utils import load_image
 from spycewar.config import get_cfg
@@ -20,6 +20,7 @@ class Powerup(GameObject):
     """Represents the health bar of a player."""
 
     __image: Surface | None = None
+    __mask: Mask | None = None
 
     def __init__(self) -> None:
         super().__init__()
@@ -29,6 +30,10 @@ class Powerup(GameObject):
         self.__spawned = False
         self.__duration = get_cfg("entities", "powerups", "health", "base_duration") + random.randint(0, 2000)
         self.__probability = get_cfg("entities", "powerups", "health", "probability")
+        # The powerup spawns at least 50 pixels away from the screen borders
+        width, height = get_cfg("game", "screen_size")
+        self.__max_x = width - 50
+        self.__max_y = height - 50
 
     @property
     def image(self) -> Surface | None:
@@ -36,6 +41,12 @@ class Powerup(GameObject):
 
         return Powerup.__image
 
+    @property
+    def mask(self) -> Mask | None:
+        """Collision mask of the powerup, shared by all the powerups."""
+
+        return Powerup.__mask
+
     @property
     def value(self) -> int:
         """Value of the powerup."""
@@ -58,23 +69,25 @@ class Powerup(GameObject):
 
         if not self.__spawned and random.random() < self.__probability:
             logger.info("Spawning health power-up...")
-            screen_width, screen_height = os.getenv("SCREEN_WIDTH") or 800, os.getenv("SCREEN_HEIGHT") or 600
-            position = Vector2(random.randint(50, int(screen_width) - 50), random.randint(50, int(screen_height) - 50))
-            self._position = position
+            self._position = Vector2(random.randint(50, self.__max_x), random.randint(50, self.__max_y))
             self.__spawned = True
             powerup_removal_event = Event(USEREVENT, event=Events.HEALTH_POWERUP_REMOVAL)
             pygame.time.set_timer(powerup_removal_event, self.__duration)
             self.rect = self.image.get_rect() if self.image else None
             self.rect.topleft = self._position
 
-    def render(self, surface_dst: Surface) -> None:
+    def render(self, surface_dst: Surface) -> Rect | None:
         """Render the health powerup on the screen.
 
         Args:
             surface_dst: the surface to render the health powerup on.
+
+        Returns:
+            The area of the surface covered by the powerup, or `None` if it is not spawned.
         """
         if self.__spawned:
-            surface_dst.blit(Powerup.__image, self._position)
+            return surface_dst.blit(Powerup.__image, self._position)
+        return None
 
     def release(self) -> None:
         """Release the health bar."""
@@ -89,4 +102,5 @@ class Powerup(GameObject):
             file_dir, filename = get_cfg("entities", "powerups", "health", "file")
             file_path = resources.files(file_dir).joinpath(filename)
             Powerup.__image = load_image(file_path)
+            Powerup.__mask = pygame.mask.from_surface(Powerup.__image)
             logger.info(f"Powerup image loaded: {Powerup.__image}")
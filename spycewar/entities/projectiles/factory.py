@@ -11,19 +11,28 @@ from spycewar.entities.projectiles.projectile import Projectile
 class ProjectileFactory:
     """Represents a factory for creating projectiles."""
 
+    __projectile_classes: dict[PlayerId, type[Projectile]] = {
+        PlayerId.PLAYER1: PlayerProjectile1,
+        PlayerId.PLAYER2: PlayerProjectile2,
+    }
+
     @staticmethod
     def create_projectile(player: PlayerId, position: Vector2, velocity: Vector2) -> Projectile:
         """Creates a projectile of the given type at the given position.
 
+        The projectile class is looked up by player id in a table, instead of comparing the player
+        id against every player.
+
         Args:
-            projectile_type: the type of projectile to create.
+            player: the id of the player firing the projectile.
             position: the position to create the projectile at.
+            velocity: the velocity of the projectile.
 
         Returns:
             A new projectile of the given type at the given position.
         """
-        if player == PlayerId.PLAYER1:
-            return PlayerProjectile1(position, velocity)
-        if player == PlayerId.PLAYER2:
-            return PlayerProjectile2(position, velocity)
-        raise ValueError(f"Invalid player id: {player}")
+        try:
+            projectile_class = ProjectileFactory.__projectile_classes[player]
+        except KeyError:
+            raise ValueError(f"Invalid player id: {player}") from None
+        return projectile_class(position, velocity)
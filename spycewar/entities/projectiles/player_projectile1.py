@@ -1,9 +1,11 @@
 """Module for the projectile class."""
 
+import math
 from importlib import resources
 
 from loguru import logger
 from pygame import Surface, Vector2
+from pygame.mask import Mask, from_surface
 
 from spycewar.assets.images.utils import load_image
 from spycewar.config import get_cfg
@@ -21,6 +23,8 @@ class PlayerProjectile1(Projectile):
     """
 
     __image: Surface | None = None
+    __mask: Mask | None = None
+    radius: float = 0.0  # Radius of the circle enclosing the image, used by the collision checks
     __mid_width: int = 0
     __mid_height: int = 0
     __player = PlayerId.PLAYER1
@@ -37,6 +41,12 @@ class PlayerProjectile1(Projectile):
 
         return PlayerProjectile1.__image
 
+    @property
+    def mask(self) -> Mask | None:
+        """Collision mask of the projectile, shared by all the projectiles of the class."""
+
+        return PlayerProjectile1.__mask
+
     @property
     def damage(self) -> int:
         """Damage of the projectile."""
@@ -53,6 +63,8 @@ class PlayerProjectile1(Projectile):
             file_dir, filename = get_cfg("entities", "projectiles", self.__player.value, "file")
             file_path = resources.files(file_dir).joinpath(filename)
             PlayerProjectile1.__image = load_image(file_path)
+            PlayerProjectile1.__mask = from_surface(PlayerProjectile1.__image)
+            PlayerProjectile1.radius = math.hypot(*PlayerProjectile1.__image.get_size()) / 2
             PlayerProjectile1.__mid_width = PlayerProjectile1.__image.get_width() / 2
             PlayerProjectile1.__mid_height = PlayerProjectile1.__image.get_height() / 2
             logger.info(f"PlayerProjectile1 image loaded: {PlayerProjectile1.__image}")
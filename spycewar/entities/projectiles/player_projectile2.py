@@ -1,9 +1,11 @@
 """Module for the projectile class."""
 
+import math
 from importlib import resources
 
 from loguru import logger
 from pygame import Surface, Vector2
+from pygame.mask import Mask, from_surface
 
 from spycewar.assets.images.utils import load_image
 from spycewar.config import get_cfg
@@ -21,6 +23,8 @@ class PlayerProjectile2(Projectile):
     """
 
     __image: Surface | None = None
+    __mask: Mask | None = None
+    radius: float = 0.0  # Radius of the circle enclosing the image, used by the collision checks
     __mid_width: int = 0
     __mid_height: int = 0
     __player = PlayerId.PLAYER2
@@ -30,6 +34,8 @@ class PlayerProjectile2(Projectile):
 
         if PlayerProjectile2.__image is None:
             PlayerProjectile2.__image = self.__load_projectile()
+            PlayerProjectile2.__mask = from_surface(PlayerProjectile2.__image)
+            PlayerProjectile2.radius = math.hypot(*PlayerProjectile2.__image.get_size()) / 2
             PlayerProjectile2.__mid_width = PlayerProjectile2.__image.get_width() / 2
             PlayerProjectile2.__mid_height = PlayerProjectile2.__image.get_height() / 2
             logger.info(f"PlayerProjectile2 image loaded: {PlayerProjectile2.__image}")
@@ -43,6 +49,12 @@ class PlayerProjectile2(Projectile):
 
         return PlayerProjectile2.__image
 
+    @property
+    def mask(self) -> Mask | None:
+        """Collision mask of the projectile, shared by all the projectiles of the class."""
+
+        return PlayerProjectile2.__mask
+
     @property
     def damage(self) -> int:
         """Damage of the projectile."""
@@ -59,8 +71,3 @@ class PlayerProjectile2(Projectile):
         file_dir, filename = get_cfg("entities", "projectiles", self.__player.value, "file")
         file_path = resources.files(file_dir).joinpath(filename)
         return load_image(file_path)
-
-    def render(self, surface_dst: Surface) -> None:
-        """Renders the projectile to the given surface at the projectile's position."""
-
-        surface_dst.blit(self.image, self._position)
@@ -1,13 +1,10 @@
 """Module for the Projectile class."""
 
-import pygame
-from pygame import Surface
+from pygame import Rect, Surface
 from pygame.event import Event
-from pygame.locals import USEREVENT
 from pygame.math import Vector2
 
 from spycewar.entities.game_object import GameObject
-from spycewar.events import Events
 
 
 class Projectile(GameObject):
@@ -36,10 +33,10 @@ class Projectile(GameObject):
     def __init__(self, position: Vector2, velocity: Vector2) -> None:
         super().__init__()
         self._position = Vector2(position)
-        self.__velocity = Vector2(velocity)
+        # The velocity is never modified, so the one computed by the ship can be shared instead of copied
+        self.__velocity = velocity if type(velocity) is Vector2 else Vector2(velocity)
 
-        self.rect = self.image.get_rect()
-        self.rect.topleft = self._position
+        self.rect = self.image.get_rect(topleft=self._position)
 
     def handle_input(self, key: int, is_pressed: bool) -> None:
         """Handles the input of the player.
@@ -60,27 +57,27 @@ class Projectile(GameObject):
         """Updates the projectile's position based on its velocity and the time passed.
 
         The projectile should be kept on the screen a given time before being released. If it goes out of bounds,
-        it should reappear on the other side of the screen.
+        it is removed from its groups straight away.
+
+        The position is integrated per component and updated in place, so no vectors are allocated per frame.
 
         Args:
             delta_time: the time passed since the last frame.
         """
 
-        distance = self.__velocity * delta_time
+        x = self._position.x + self.__velocity.x * delta_time
+        y = self._position.y + self.__velocity.y * delta_time
 
-        if self._in_bounds(distance):
-            self._position += distance
+        if self._in_bounds(x, y):
+            self._position.update(x, y)
+            self.rect.topleft = self._position  # The size never changes, so the rect is moved in place
         else:
-            kill_event = Event(USEREVENT, event=Events.PROJECTILE_OUT_OF_SCREEN, projectile=self)
-            pygame.event.post(kill_event)
-
-        self.rect = self.image.get_rect()
-        self.rect.topleft = self._position
+            self.kill()
 
-    def render(self, surface_dst: Surface) -> None:
+    def render(self, surface_dst: Surface) -> Rect:
         """Renders the projectile to the given surface at the projectile's position."""
 
-        surface_dst.blit(self.image, self._position)
+        return surface_dst.blit(self.image, self._position)
 
     def release(self) -> None:
         """Releases any resources from the projectile."""
@@ -3,11 +3,22 @@
 It extends the Pygame sprite group class to add game-specific functionality.
 """
 
+from typing import Callable, Protocol, cast
+
 import pygame
 from loguru import logger
-from pygame import Surface
+from pygame import Rect, Surface, Vector2
 from pygame.event import Event
-from pygame.sprite import Group
+from pygame.sprite import Group, Sprite
+
+from spycewar.entities.game_object import GameObject
+
+
+class _BatchSprite(Protocol):
+    """A sprite that can be drawn by a `BatchRenderGroup`, by blitting its image at its position."""
+
+    image: Surface
+    pos: Vector2
 
 
 class RenderGroup(Group):
@@ -28,9 +39,22 @@ class RenderGroup(Group):
     def __init__(self) -> None:
         """Initializes the RenderGroup."""
 
+        self.__renderers: dict[Sprite, Callable[[Surface], Rect | None]] = {}
         super().__init__()
         logger.info("RenderGroup initialized.")
 
+    def add_internal(self, sprite: Sprite, layer: None = None) -> None:
+        """Adds the sprite to the group and caches its bound render method."""
+
+        super().add_internal(sprite, layer)
+        self.__renderers[sprite] = cast(GameObject, sprite).render
+
+    def remove_internal(self, sprite: Sprite) -> None:
+        """Removes the sprite and its bound render method from the group."""
+
+        super().remove_internal(sprite)
+        del self.__renderers[sprite]
+
     def handle_input(self, key: pygame.key, is_pressed: bool) -> None:
         """Passes input events to all sprites in the group.
 
@@ -54,16 +78,20 @@ class RenderGroup(Group):
         for sprite in self.sprites():
             sprite.process_events(event)
 
-    def render(self, surface_dst: Surface) -> None:
+    def render(self, surface_dst: Surface) -> list[Rect]:
         """Renders all sprites in the group to the given surface.
 
-        Iterates through all sprites, calling their render method.
+        Calls the render method of every sprite, bound once when the sprite was added to the group.
+        Rendering never adds or removes sprites, so the methods are iterated directly instead of over a
+        copy of the sprites.
 
         Args:
             surface_dst: The Pygame surface to render sprites onto.
+
+        Returns:
+            The areas of the surface drawn by the sprites.
         """
-        for sprite in self.sprites():
-            sprite.render(surface_dst)
+        return [rect for render in self.__renderers.values() if (rect := render(surface_dst))]
 
     def release(self) -> None:
         """Calls the release method of all sprites in the group.
@@ -72,3 +100,58 @@ class RenderGroup(Group):
         """
         for sprite in self.sprites():
             sprite.release()
+
+
+class BatchRenderGroup(RenderGroup):
+    """A render group that draws all its sprites with a single `Surface.blits` call.
+
+    Meant for sprites whose rendering is just blitting their image at their position (e.g. projectiles),
+    so the per-sprite `render` calls can be replaced by one batched call into pygame.
+
+    The blit sequence is a list kept up to date when sprites are added or removed, holding references to
+    the image and the position of each sprite, so it is passed to pygame as it is in every frame. Therefore,
+    sprites must update their position in place and never replace their image or position objects.
+
+    A removed sprite is replaced in the blit sequence by the last one, so the drawing order of the sprites
+    is not kept.
+    """
+
+    def __init__(self) -> None:
+        """Initializes the BatchRenderGroup."""
+
+        self.__blit_sequence: list[tuple[Surface, Vector2]] = []
+        self.__blit_sprites: list[Sprite] = []  # The sprite of each entry of the blit sequence
+        self.__blit_indices: dict[Sprite, int] = {}  # The index of each sprite in the blit sequence
+        super().__init__()
+
+    def add_internal(self, sprite: Sprite, layer: None = None) -> None:
+        """Adds the sprite to the group and its image and position to the blit sequence."""
+
+        super().add_internal(sprite, layer)
+        self.__blit_indices[sprite] = len(self.__blit_sequence)
+        batch_sprite = cast(_BatchSprite, sprite)
+        self.__blit_sequence.append((batch_sprite.image, batch_sprite.pos))
+        self.__blit_sprites.append(sprite)
+
+    def remove_internal(self, sprite: Sprite) -> None:
+        """Removes the sprite from the group and from the blit sequence, moving the last entry to its place."""
+
+        super().remove_internal(sprite)
+        index = self.__blit_indices.pop(sprite)
+        last_entry = self.__blit_sequence.pop()
+        last_sprite = self.__blit_sprites.pop()
+        if index < len(self.__blit_sequence):
+            self.__blit_sequence[index] = last_entry
+            self.__blit_sprites[index] = last_sprite
+            self.__blit_indices[last_sprite] = index
+
+    def render(self, surface_dst: Surface) -> list[Rect]:
+        """Renders all sprites in the group to the given surface in a single batch.
+
+        Args:
+            surface_dst: The Pygame surface to render sprites onto.
+
+        Returns:
+            The areas of the surface drawn by the sprites.
+        """
+        return surface_dst.blits(self.__blit_sequence) or []
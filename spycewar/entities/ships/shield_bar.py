@@ -1,6 +1,6 @@
 """Module for the shield bar of the players."""
 
-from pygame import Surface
+from pygame import Rect, Surface
 from pygame.draw import rect
 from pygame.event import Event
 
@@ -24,6 +24,8 @@ class ShieldBar(GameObject):
         self.__height = 7
         self.__max_shield = get_cfg("entities", "ships", player_id.value, "max_shield")
         self.__shield = self.__max_shield
+        self.__bar_surface = Surface((self.__width, self.__height)).convert()
+        self.__render_bar()
 
     @property
     def ratio(self) -> float:
@@ -36,20 +38,30 @@ class ShieldBar(GameObject):
 
     def process_events(self, event: Event) -> None:
         if event.event == Events.SHIELD_ACTIVATED and event.player.state.player_id == self.player_id:
-            self.__shield = event.player.state.shield
+            if event.player.state.shield != self.__shield:
+                self.__shield = event.player.state.shield
+                self.__render_bar()
 
     def update(self, delta_time: float) -> None:
         """Update the shield bar."""
 
-    def render(self, surface_dst: Surface) -> None:
+    def render(self, surface_dst: Surface) -> Rect:
         """Render the shield bar on the screen.
 
         Args:
             surface_dst: the surface to render the shield bar on.
+
+        Returns:
+            The area of the surface covered by the bar.
         """
-        color = (90, 144, 178) if self.ratio > 0.2 else ("orange")
-        rect(surface_dst, self.__empty_color, (self.__x, self.__y, self.__width, self.__height))
-        rect(surface_dst, color, (self.__x + 1, self.__y + 1, self.__width * self.ratio - 2, self.__height - 2))
+        return surface_dst.blit(self.__bar_surface, (self.__x, self.__y))
 
     def release(self) -> None:
         """Release the shield bar."""
+
+    def __render_bar(self) -> None:
+        """Draws the bar to the cached surface, which only changes when the shield changes."""
+
+        color = (90, 144, 178) if self.ratio > 0.2 else ("orange")
+        self.__bar_surface.fill(self.__empty_color)
+        rect(self.__bar_surface, color, (1, 1, self.__width * self.ratio - 2, self.__height - 2))
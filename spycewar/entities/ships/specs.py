@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from importlib import resources
+from typing import ClassVar
 
+import pygame
 from pygame import Surface
+from pygame.mask import Mask
 
 from spycewar.assets.images.utils import load_image
 from spycewar.config import get_cfg
@@ -13,13 +16,15 @@ from spycewar.entities.players.enums import PlayerId
 from spycewar.events import Events
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ShipSpecs:
     """Represents the specifications of a ship.
 
     Attributes:
         player: the player id of the ship.
         image: the image of the ship.
+        rotated_images: the image of the ship rotated to every degree, indexed by angle.
+        rotated_masks: the collision masks of the rotated images, indexed by angle.
         max_speed: the maximum speed of the ship.
         acceleration: the acceleration of the ship.
         rotation_speed: the rotation speed of the ship.
@@ -31,6 +36,8 @@ class ShipSpecs:
     player: PlayerId
     fire_event: Events
     image: Surface
+    rotated_images: tuple[Surface, ...] = field(repr=False)
+    rotated_masks: tuple[Mask, ...] = field(repr=False)
     max_speed: float
     max_shield: float
     acceleration: float
@@ -39,16 +46,34 @@ class ShipSpecs:
     projectile_cooldown: float
     hyperspace_cooldown: float
 
+    __specs: ClassVar[dict[PlayerId, ShipSpecs]] = {}  # Ship specifications, loaded once per player
+
     @classmethod
     def load_ship_specs(cls, player: PlayerId) -> ShipSpecs:
         """Loads the ship specifications from the configuration file.
 
+        The specifications (including the ship images) are loaded the first time they are requested
+        for a player, and shared afterwards, since they are immutable.
+
+        Args:
+            player: the player id of the ship to load the specifications for.
+        """
+        if player not in cls.__specs:
+            cls.__specs[player] = cls.__load_ship_specs(player)
+        return cls.__specs[player]
+
+    @classmethod
+    def __load_ship_specs(cls, player: PlayerId) -> ShipSpecs:
+        """Reads the ship specifications of the given player from the configuration file.
+
         Args:
-            ship_name: the name of the ship to load the specifications for.
+            player: the player id of the ship.
         """
         file_dir, filename = get_cfg("entities", "ships", player.value, "file")
         file_path = resources.files(file_dir).joinpath(filename)
         image = load_image(file_path)
+        rotated_images = tuple(pygame.transform.rotate(image, angle) for angle in range(360))
+        rotated_masks = tuple(pygame.mask.from_surface(rotated_image) for rotated_image in rotated_images)
 
         fire_event = Events(get_cfg("entities", "players", player.value, "fire_event"))
         max_speed = get_cfg("entities", "ships", player.value, "max_speed")
@@ -63,6 +88,8 @@ class ShipSpecs:
             player,
             fire_event,
             image,
+            rotated_images,
+            rotated_masks,
             max_speed,
             max_shield,
             acceleration,
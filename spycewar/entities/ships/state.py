@@ -5,12 +5,13 @@ from dataclasses import dataclass, field
 from pygame import Vector2
 
 
-@dataclass
+@dataclass(slots=True)
 class ShipState:
     """Represents the state of a ship.
 
+    The state is updated every frame, so it uses slots for faster attribute access.
+
     Attributes:
-        position: the position of the ship.
         velocity: the velocity of the ship. Stationary at the start.
         angle: the angle of the ship.
         is_accelerating: a boolean indicating whether the ship is accelerating.
@@ -19,7 +20,6 @@ class ShipState:
     """
 
     velocity: Vector2 = field(default_factory=lambda: Vector2(0, 0))
-    speed: float = 0.0
     angle: float = 0.0
     is_accelerating: bool = False
     is_turning_left: bool = False
@@ -1,14 +1,12 @@
 """Module for the thruster entity."""
 
-import pygame
-from pygame import USEREVENT, Surface
+from pygame import Rect, Surface
 from pygame.event import Event
 from pygame.math import Vector2
 from pygame.sprite import Group
 
 from spycewar.assets.particle import Particle
 from spycewar.entities.game_object import GameObject
-from spycewar.events import Events
 
 
 class Thrust(GameObject):
@@ -27,18 +25,21 @@ class Thrust(GameObject):
         """Processes the events for the explosion entity."""
 
     def update(self, delta_time: float) -> None:
-        """Updates the explosion entity."""
+        """Updates the explosion entity.
+
+        Once all its particles are gone, the thrust removes itself from its groups straight away.
+        """
 
         self.particle_group.update(delta_time)
 
-        if len(self.particle_group) <= 0:
-            kill_event = Event(USEREVENT, event=Events.THRUST_EXHAUSTED, thrust=self)
-            pygame.event.post(kill_event)
+        if not self.particle_group:
+            self.kill()
 
-    def render(self, surface_dst: Surface) -> None:
+    def render(self, surface_dst: Surface) -> Rect | None:
         """Renders the explosion entity."""
 
-        self.particle_group.draw(surface_dst)
+        rects = surface_dst.blits([(particle.image, particle.rect) for particle in self.particle_group])
+        return rects[0].unionall(rects[1:]) if rects else None
 
     def release(self) -> None:
         """Releases the resources for the explosion entity."""
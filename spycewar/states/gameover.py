@@ -24,6 +24,7 @@ class GameOver(State):
 
         self.next_state = GameState.INTRO
         self.done = False
+        self.animated = False
         self.context: GameContext = GameContext()
         self.__title = Surface((0, 0))
         self.__result = Surface((0, 0))
@@ -81,40 +82,47 @@ class GameOver(State):
             surface_dst: the surface to render the gameover text to.
         """
 
-        self.__display_title(surface_dst)
-        self.__display_result(surface_dst)
-        self.__display_subtitle(surface_dst)
+        width, height = surface_dst.get_size()
+        self.__display_title(surface_dst, width, height)
+        self.__display_result(surface_dst, width, height)
+        self.__display_subtitle(surface_dst, width, height)
 
-    def __display_title(self, surface_dst: Surface) -> None:
+    def __display_title(self, surface_dst: Surface, width: int, height: int) -> None:
         """Displays the title text on the given surface.
 
         Args:
             surface_dst: the surface to render the title text to.
+            width: the width of the surface.
+            height: the height of the surface.
         """
 
-        position = surface_dst.get_width() // 2, surface_dst.get_height() // 2.1
+        position = width // 2, height // 2.1
         rect = self.__title.get_rect(center=position)
         surface_dst.blit(self.__title, rect.topleft)
 
-    def __display_subtitle(self, surface_dst: Surface) -> None:
+    def __display_subtitle(self, surface_dst: Surface, width: int, height: int) -> None:
         """Displays the subtitle text on the given surface.
 
         Args:
             surface_dst: the surface to render the subtitle text to.
+            width: the width of the surface.
+            height: the height of the surface.
         """
 
-        position = surface_dst.get_width() // 2, surface_dst.get_height() // 1.1
+        position = width // 2, height // 1.1
         rect = self.__subtitle.get_rect(center=position)
         surface_dst.blit(self.__subtitle, rect.topleft)
 
-    def __display_result(self, surface_dst: Surface) -> None:
+    def __display_result(self, surface_dst: Surface, width: int, height: int) -> None:
         """Displays the result text on the given surface.
 
         Args:
             surface_dst: the surface to render the result text to.
+            width: the width of the surface.
+            height: the height of the surface.
         """
 
-        position = surface_dst.get_width() // 2, surface_dst.get_height() // 1.7
+        position = width // 2, height // 1.7
         rect = self.__result.get_rect(center=position)
         surface_dst.blit(self.__result, rect.topleft)
 
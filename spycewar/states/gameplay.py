@@ -1,23 +1,23 @@
 """Module for the gameplay state in the game's state machine."""
 
-import os
+from itertools import combinations
+from typing import Callable
 
 import pygame
 from loguru import logger
-from pygame import Surface, Vector2
+from pygame import Rect, Surface, Vector2
 from pygame.event import Event
 from pygame.locals import KEYDOWN, KEYUP, USEREVENT
-from pygame.sprite import collide_mask, collide_rect, groupcollide
+from pygame.sprite import collide_circle, collide_mask, collide_rect, groupcollide
 
-from spycewar.constants import SCREEN_WIDTH_ENV_VAR
+from spycewar.config import get_cfg
 from spycewar.entities.explosion import Explosion
 from spycewar.entities.players.enums import PlayerId
 from spycewar.entities.players.health_bar import HealthBar
 from spycewar.entities.players.player import Player
 from spycewar.entities.powerup import Powerup
 from spycewar.entities.projectiles.factory import ProjectileFactory
-from spycewar.entities.projectiles.projectile import Projectile
-from spycewar.entities.render_group import RenderGroup
+from spycewar.entities.render_group import BatchRenderGroup, RenderGroup
 from spycewar.entities.ships.shield_bar import ShieldBar
 from spycewar.entities.ships.thruster import Thrust
 from spycewar.enums.states import GameState
@@ -42,24 +42,45 @@ class Gameplay(State):
         self.next_state = GameState.GAMEOVER
         self.context = GameContext()
         self.__players = RenderGroup()
-        self.__projectiles = RenderGroup()
+        self.__projectiles = BatchRenderGroup()
         self.__explosions = RenderGroup()
         self.__thrusts = RenderGroup()
         self.__heath_bars = RenderGroup()
         self.__shield_bars = RenderGroup()
         self.__powerups = RenderGroup()
+        self.__right_hud_x = get_cfg("game", "screen_size")[0] - 160
+        self.__gameover_at: int | None = None  # Ticks at which the game ends after a player died
+        # All the groups, in drawing order, and the ones whose entities react to game events
+        self.__groups = (
+            self.__players,
+            self.__projectiles,
+            self.__explosions,
+            self.__thrusts,
+            self.__heath_bars,
+            self.__shield_bars,
+            self.__powerups,
+        )
+        self.__event_groups = (self.__players, self.__heath_bars, self.__shield_bars, self.__powerups)
+        self.__event_handlers: dict[Events, Callable[[Event], None]] = {
+            Events.PLAYER1_FIRES: lambda event: self.__spawn_projectile(PlayerId.PLAYER1, event.pos, event.vel),
+            Events.PLAYER2_FIRES: lambda event: self.__spawn_projectile(PlayerId.PLAYER2, event.pos, event.vel),
+            Events.THRUST: lambda event: self.__spawn_thrust(event.pos, event.dir_),
+            Events.EXPLOSION_OVER: lambda event: self.__kill_explosion(event.explosion),
+            Events.PLAYER_DIED: lambda event: self.__handle_player_died(event.player),
+        }
 
     def enter(self, context: GameContext) -> None:
         """Resets the state to indicate the game is not done when entering the gameplay state."""
 
         logger.info("Entering gameplay state...")
         self.done = False
+        self.__gameover_at = None
         self.__players.add(Player(PlayerId.PLAYER1))
         self.__players.add(Player(PlayerId.PLAYER2))
         self.__heath_bars.add(HealthBar(PlayerId.PLAYER1, 10, 10))
-        self.__heath_bars.add(HealthBar(PlayerId.PLAYER2, int(os.environ[SCREEN_WIDTH_ENV_VAR]) - 160, 10))
+        self.__heath_bars.add(HealthBar(PlayerId.PLAYER2, self.__right_hud_x, 10))
         self.__shield_bars.add(ShieldBar(PlayerId.PLAYER1, 10, 30))
-        self.__shield_bars.add(ShieldBar(PlayerId.PLAYER2, int(os.environ[SCREEN_WIDTH_ENV_VAR]) - 160, 30))
+        self.__shield_bars.add(ShieldBar(PlayerId.PLAYER2, self.__right_hud_x, 30))
         self.__powerups.add(Powerup())
         self.context = context
 
@@ -68,13 +89,8 @@ class Gameplay(State):
 
         Currently does nothing.
         """
-        self.__players.empty()
-        self.__projectiles.empty()
-        self.__explosions.empty()
-        self.__thrusts.empty()
-        self.__heath_bars.empty()
-        self.__shield_bars.empty()
-        self.__powerups.empty()
+        for group in self.__groups:
+            group.empty()
 
         return self.context
 
@@ -92,17 +108,15 @@ class Gameplay(State):
     def process_events(self, event: Event) -> None:
         """Placeholder for processing other game events.
 
+        Projectiles, explosions and thrusts do not react to events, so the events are only passed to the groups
+        whose entities do, instead of to every short-lived entity on the screen.
+
         Args:
             event: The game event to process.
         """
         self.__handle_events(event)
-        self.__players.process_events(event)
-        self.__projectiles.process_events(event)
-        self.__explosions.process_events(event)
-        self.__thrusts.process_events(event)
-        self.__heath_bars.process_events(event)
-        self.__shield_bars.process_events(event)
-        self.__powerups.process_events(event)
+        for group in self.__event_groups:
+            group.process_events(event)
 
     def update(self, delta_time: float) -> None:
         """Updates the game logic for the gameplay state.
@@ -111,29 +125,26 @@ class Gameplay(State):
             delta_time: The time elapsed since the last frame.
         """
 
-        self.__players.update(delta_time)
-        self.__projectiles.update(delta_time)
-        self.__explosions.update(delta_time)
-        self.__thrusts.update(delta_time)
-        self.__heath_bars.update(delta_time)
-        self.__shield_bars.update(delta_time)
-        self.__powerups.update(delta_time)
+        for group in self.__groups:
+            group.update(delta_time)
         self.__detect_collisions()
+        if self.__gameover_at is not None and pygame.time.get_ticks() >= self.__gameover_at:
+            self.__handle_gameover()
 
-    def render(self, surface_dst: Surface) -> None:
+    def render(self, surface_dst: Surface) -> list[Rect]:
         """Renders the game entities to the given surface.
 
         Args:
             surface_dst: The surface to render the game entities to.
+
+        Returns:
+            The areas of the surface drawn by the game entities.
         """
 
-        self.__players.render(surface_dst)
-        self.__projectiles.render(surface_dst)
-        self.__explosions.render(surface_dst)
-        self.__thrusts.render(surface_dst)
-        self.__heath_bars.render(surface_dst)
-        self.__shield_bars.render(surface_dst)
-        self.__powerups.render(surface_dst)
+        dirty_rects = []
+        for group in self.__groups:
+            dirty_rects += group.render(surface_dst)
+        return dirty_rects
 
     def release(self) -> None:
         """Releases resources associated with the gameplay state.
@@ -141,40 +152,41 @@ class Gameplay(State):
         Args:
             surface_dst: The surface to release resources from.
         """
-        self.__players.release()
-        self.__projectiles.release()
-        self.__explosions.release()
-        self.__thrusts.release()
-        self.__heath_bars.release()
-        self.__shield_bars.release()
-        self.__powerups.release()
+        for group in self.__groups:
+            group.release()
 
     def __handle_events(self, event: Event) -> None:
         """Handles game events for the gameplay state.
 
+        The handler of the event is looked up in a dispatch table, instead of comparing the event
+        against every type of event.
+
         Args:
             event: The game event to handle.
         """
 
-        if event.event == Events.PLAYER1_FIRES:
-            self.__spawn_projectile(PlayerId.PLAYER1, event.pos, event.vel)
-        if event.event == Events.PLAYER2_FIRES:
-            self.__spawn_projectile(PlayerId.PLAYER2, event.pos, event.vel)
-        if event.event == Events.THRUST:
-            self.__spawn_thrust(event.pos, event.dir_)
-        if event.event == Events.PROJECTILE_OUT_OF_SCREEN:
-            self.__kill_projectile(event.projectile)
-        if event.event == Events.THRUST_EXHAUSTED:
-            self.__kill_thrust(event.thrust)
-        if event.event == Events.EXPLOSION_OVER:
-            self.__kill_explosion(event.explosion)
-        if event.event == Events.PLAYER_DIED:
-            self.__kill_player(event.player)
-            self.__game_over()
-
-        if event.event == Events.GAMEOVER:
-            self.done = True
-            logger.info("Game over!")
+        if handler := self.__event_handlers.get(event.event):
+            handler(event)
+
+    def __handle_player_died(self, player: Player) -> None:
+        """Removes the dead player from the game and triggers the game over.
+
+        Args:
+            player: The player that died.
+        """
+        self.__kill_player(player)
+        self.__game_over()
+
+    def __handle_gameover(self) -> None:
+        """Marks the gameplay state as done when the game is over.
+
+        The gameover event is still posted so that the application switches the background colour.
+        """
+
+        self.done = True
+        self.__gameover_at = None
+        pygame.event.post(Event(USEREVENT, event=Events.GAMEOVER, color=(0, 0, 0)))
+        logger.info("Game over!")
 
     def __spawn_projectile(self, player: PlayerId, position: Vector2, velocity: Vector2) -> None:
         """Spawns a projectile of the given type at the specified position.
@@ -197,32 +209,6 @@ class Gameplay(State):
         """
         self.__thrusts.add(Thrust(position, direction))
 
-    def __kill_projectile(self, projectile: Projectile) -> None:
-        """Removes the given projectile from the game.
-
-        Args:
-            projectile: The projectile to remove.
-        """
-
-        if projectile in self.__projectiles:
-            self.__projectiles.remove(projectile)
-            del projectile
-        else:
-            logger.error("Trying to remove a projectile that is not in the game.")
-
-    def __kill_thrust(self, thrust: Thrust) -> None:
-        """Removes the given thrust from the game.
-
-        Args:
-            thrust: The thrust to remove.
-        """
-
-        if thrust in self.__thrusts:
-            self.__thrusts.remove(thrust)
-            del thrust
-        else:
-            logger.error("Trying to remove a thrust that is not in the game.")
-
     def __kill_explosion(self, explosion: Explosion) -> None:
         """Removes the given explosion from the game.
 
@@ -232,7 +218,6 @@ class Gameplay(State):
 
         if explosion in self.__explosions:
             self.__explosions.remove(explosion)
-            del explosion
         else:
             logger.error("Trying to remove an explosion that is not in the game.")
 
@@ -244,9 +229,8 @@ class Gameplay(State):
         """
 
         if player in self.__players:
-            logger.info(f"Player {player} died.")
+            logger.info("Player {} died.", player)
             self.__players.remove(player)
-            del player
         else:
             logger.error(f"Trying to remove a player {player} that is not in the game.")
 
@@ -264,42 +248,46 @@ class Gameplay(State):
         """Detects collisions between the players and the projectiles.
 
         For efficiency reasons, we only check for mask collisions if the collision is first
-        detected by the rectangle.
+        detected by the rectangle and then by the enclosing circles.
         """
 
-        for i, player1 in enumerate(self.__players):
-            for player2 in self.__players.sprites()[i + 1 :]:
-                if (
-                    player1.pos != player2.pos
-                    and collide_rect(player1, player2)
-                    and (player1.pos != player2.pos and collide_mask(player1, player2))
-                ):
-                    self.__spawn_explosion(player1.pos)
-                    self.__spawn_explosion(player2.pos)
-                    self.__kill_player(player1)
-                    self.__kill_player(player2)
-                    self.__game_over()
-                    logger.info("Player hit by player (mask)!")
+        for player1, player2 in combinations(self.__players.sprites(), 2):
+            if (
+                player1.pos != player2.pos
+                and collide_rect(player1, player2)
+                and collide_circle(player1, player2)
+                and collide_mask(player1, player2)
+            ):
+                self.__spawn_explosion(player1.pos)
+                self.__spawn_explosion(player2.pos)
+                self.__kill_player(player1)
+                self.__kill_player(player2)
+                self.__game_over()
+                logger.debug("Player hit by player (mask)!")
 
     def __detect_player_vs_projectile(self) -> None:
         """Detects collisions between the players and the projectiles.
 
         For efficiency reasons, we only check for mask collisions if the collision is first
-        detected by the rectangle.
+        detected by the rectangle and then by the enclosing circles.
 
-        The projectile is removed from the game if it hits a player; then, it is still necessary to
-        check if the player is still in the game (results group).
+        The projectiles hitting a player are removed from the game, but the player only takes the damage of the first
+        one in the same frame. Only the pairs found by the rectangle check are tested with masks, in a single pass.
         """
-        for player in groupcollide(self.__players, self.__projectiles, False, False, collide_rect):
+        for player, projectiles in groupcollide(self.__players, self.__projectiles, False, False, collide_rect).items():
             if player.is_shielded and player.state.shield > 0:
                 continue
-            if results := groupcollide(self.__players, self.__projectiles, False, True, collide_mask):
-                if player in results:
-                    self.__spawn_explosion(results[player][0].pos)
-                    damage = results[player][0].damage
-                    hit_event = Event(USEREVENT, event=Events.PLAYER_HIT, player=player, damage=damage)
-                    pygame.event.post(hit_event)
-                    logger.info("Player hit by projectile (mask)!")
+            if hits := [
+                projectile
+                for projectile in projectiles
+                if collide_circle(player, projectile) and collide_mask(player, projectile)
+            ]:
+                self.__spawn_explosion(hits[0].pos)
+                hit_event = Event(USEREVENT, event=Events.PLAYER_HIT, player=player, damage=hits[0].damage)
+                pygame.event.post(hit_event)
+                for projectile in hits:
+                    projectile.kill()
+                logger.debug("Player hit by projectile (mask)!")
 
     def __detect_player_vs_powerup(self) -> None:
         """Detects collisions between the players and the powerups.
@@ -318,7 +306,7 @@ class Gameplay(State):
                 )
                 pygame.event.post(powerup_event)
                 self.__powerups.add(Powerup())
-                logger.info(f"Player {player} picked up powerup!")
+                logger.info("Player {} picked up powerup!", player)
 
     def __spawn_explosion(self, position: Vector2) -> None:
         """Spawns an explosion at the given position.
@@ -326,14 +314,16 @@ class Gameplay(State):
         Args:
             position: The position to spawn the explosion at.
         """
-        logger.info(f"Explosion at {position}")
+        logger.debug("Explosion at {}", position)
         self.__explosions.add(Explosion(position))
 
     def __game_over(self, trigger_delay: int = 3000) -> None:
-        """Post gameover event with some delay after the kill."""
+        """Schedule the game over with some delay after the kill.
+
+        The deadline is checked on every update, instead of going through a timer event in the queue.
+        """
         logger.info("Game over event triggered.")
         winner = self.__players.sprites()[0].player_id.name if len(self.__players) == 1 else None
-        logger.info(f"Winner: {winner}")
+        logger.info("Winner: {}", winner)
         self.context.set_data(winner=winner)
-        gameover_event = Event(USEREVENT, event=Events.GAMEOVER, color=(0, 0, 0))
-        pygame.time.set_timer(gameover_event, trigger_delay, 1)
+        self.__gameover_at = pygame.time.get_ticks() + trigger_delay
@@ -33,6 +33,7 @@ class Intro(State):
         self.__render_subtext()
         self.next_state = GameState.GAMEPLAY
         self.done = False
+        self.animated = False
         self.context = GameContext()
 
         logger.info("Introduction state initialized.")
@@ -77,8 +78,9 @@ class Intro(State):
             surface_dst: the surface to render the introduction text to.
         """
 
-        self.__display_title(surface_dst)
-        self.__display_subtitle(surface_dst)
+        width, height = surface_dst.get_size()
+        self.__display_title(surface_dst, width, height)
+        self.__display_subtitle(surface_dst, width, height)
 
     def release(self) -> None:
         """Releases resources used by the introduction state, currently doing nothing."""
@@ -95,24 +97,28 @@ class Intro(State):
         font = initialise_font("microgramma.ttf", 48)
         self.__title = render_text(font, " ".join(f"{GAME_NAME}"))
 
-    def __display_subtitle(self, surface_dst: Surface) -> None:
+    def __display_subtitle(self, surface_dst: Surface, width: int, height: int) -> None:
         """Displays the subtitle text on the given surface.
 
         Args:
             surface_dst: the surface to render the subtitle text to.
+            width: the width of the surface.
+            height: the height of the surface.
         """
 
-        position = surface_dst.get_width() // 2, surface_dst.get_height() // 1.6
+        position = width // 2, height // 1.6
         rect = self.__sub.get_rect(center=position)
         surface_dst.blit(self.__sub, rect.topleft)
 
-    def __display_title(self, surface_dst: Surface) -> None:
+    def __display_title(self, surface_dst: Surface, width: int, height: int) -> None:
         """Displays the title text on the given surface.
 
         Args:
             surface_dst: the surface to render the title text to.
+            width: the width of the surface.
+            height: the height of the surface.
         """
 
-        position = surface_dst.get_width() // 2, surface_dst.get_height() // 2
+        position = width // 2, height // 2
         rect = self.__title.get_rect(center=position)
         surface_dst.blit(self.__title, rect.topleft)
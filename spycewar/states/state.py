@@ -2,7 +2,7 @@
 
 from abc import ABC, abstractmethod
 
-from pygame import Surface
+from pygame import Rect, Surface
 from pygame.event import Event
 
 from spycewar.enums.states import GameState
@@ -19,9 +19,12 @@ class State(ABC):
     def __init__(self) -> None:
         """Initializes the state with default values.
 
-        Sets the state as not done, with no next or previous state defined.
+        Sets the state as not done, with no next or previous state defined. States are animated by
+        default; static states (e.g. text screens) should set `animated` to `False` so the game loop
+        can sleep until an event arrives instead of redrawing every frame.
         """
         self.done = False
+        self.animated = True
         self.next_state = GameState.NONE
         self.previous_state = GameState.NONE
         self.context = GameContext()
@@ -52,8 +55,12 @@ class State(ABC):
         """Updates the state logic."""
 
     @abstractmethod
-    def render(self, surface_dst: Surface) -> None:
-        """Renders the state to the given surface."""
+    def render(self, surface_dst: Surface) -> list[Rect] | None:
+        """Renders the state to the given surface.
+
+        Returns:
+            The areas of the surface that have been drawn, or `None` if the whole surface must be updated.
+        """
 
     @abstractmethod
     def release(self) -> None:
@@ -1,7 +1,7 @@
 """Module for managing game states."""
 
 from loguru import logger
-from pygame import Surface
+from pygame import Rect, Surface
 from pygame.event import Event
 from pygame.locals import USEREVENT
 
@@ -10,28 +10,42 @@ from spycewar.states.game_context import GameContext
 from spycewar.states.gameover import GameOver
 from spycewar.states.gameplay import Gameplay
 from spycewar.states.intro import Intro
+from spycewar.states.state import State
 
 
 class StateManager:
     """Manages the game states and transitions between them.
 
     Attributes:
-        __states: A dictionary mapping game state names to their corresponding state objects.
+        __state_classes: A dictionary mapping game state names to the classes implementing them.
+        __states: A dictionary mapping game state names to their state objects, created when first entered.
         __current_state_name: The name of the current state.
         __current_state: The current state object.
     """
 
     def __init__(self) -> None:
         """Initializes the StateManager with predefined states."""
-        self.__states = {
-            GameState.INTRO: Intro(),
-            GameState.GAMEPLAY: Gameplay(),
-            GameState.GAMEOVER: GameOver(),
+        self.__state_classes: dict[GameState, type[State]] = {
+            GameState.INTRO: Intro,
+            GameState.GAMEPLAY: Gameplay,
+            GameState.GAMEOVER: GameOver,
         }
+        self.__states: dict[GameState, State] = {}
 
         self.__current_state_name = GameState.INTRO
-        self.__current_state = self.__states[self.__current_state_name]
+        self.__current_state = self.__get_state(self.__current_state_name)
         self.__current_state.enter(GameContext())
+        self.__state_changed = True
+
+    @property
+    def is_animated(self) -> bool:
+        """Indicates whether the current state needs to be updated and rendered every frame."""
+        return self.__current_state.animated
+
+    @property
+    def needs_full_redraw(self) -> bool:
+        """Indicates whether the whole screen must be redrawn, i.e. the state has just changed or it is static."""
+        return self.__state_changed or not self.__current_state.animated
 
     def process_events(self, event: Event) -> None:
         """Processes events by passing them to the current state.
@@ -59,9 +73,18 @@ class StateManager:
 
         self.__current_state.update(delta_time)
 
-    def render(self, surface_dst: Surface) -> None:
-        """Renders the current state to the given surface."""
-        self.__current_state.render(surface_dst)
+    def render(self, surface_dst: Surface) -> list[Rect] | None:
+        """Renders the current state to the given surface.
+
+        Whether the whole surface must be updated (e.g. right after a state change) is signalled by
+        `needs_full_redraw`, so the areas drawn by the state are always returned and can be cleared in
+        the next frame.
+
+        Returns:
+            The areas of the surface that have been drawn, or `None` if the state drew the whole surface.
+        """
+        self.__state_changed = False
+        return self.__current_state.render(surface_dst)
 
     def release(self) -> None:
         """Releases resources associated with the current state."""
@@ -74,6 +97,20 @@ class StateManager:
         logger.info(f"Context: {context.data}")
         previous_state = self.__current_state_name
         self.__current_state_name = self.__current_state.next_state
-        self.__current_state = self.__states[self.__current_state_name]
+        self.__current_state = self.__get_state(self.__current_state_name)
         self.__current_state.previous_state = previous_state
         self.__current_state.enter(context)
+        self.__state_changed = True
+
+    def __get_state(self, name: GameState) -> State:
+        """Returns the state object for the given name, creating it the first time it is needed.
+
+        Args:
+            name: The name of the state.
+
+        Returns:
+            The state object.
+        """
+        if name not in self.__states:
+            self.__states[name] = self.__state_classes[name]()
+        return self.__states[name]